@@ -42,7 +42,8 @@ class DeprecatorRegistry:
         """
 
         pkg_name = PackageName(package_name)
-        if pkg_name not in self._deprecators:
+        res = self._deprecators.get(pkg_name)
+        if res is None:
             # Special handling for test packages starting with colon
             if is_test_package(pkg_name):
                 # Test packages must provide an explicit version
@@ -60,7 +61,7 @@ class DeprecatorRegistry:
             pending, deprecation, expired_warning = create_package_warning_classes(
                 pkg_name, package_version
             )
-            self._deprecators[pkg_name] = Deprecator(
+            res = self._deprecators[pkg_name] = Deprecator(
                 pkg_name,
                 package_version,
                 pending=pending,
@@ -69,8 +70,6 @@ class DeprecatorRegistry:
                 registry=self,
             )
 
-        res = self._deprecators[pkg_name]
-
         if _version is not None and res.current_version != _version:
             warnings.warn(
                 f"Deprecator for {package_name}"
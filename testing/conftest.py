@@ -2,22 +2,39 @@
 
 from __future__ import annotations
 
+import importlib.metadata
 import warnings
 from collections.abc import Callable, Generator
-from contextlib import contextmanager
+from functools import cache, singledispatch
+from types import TracebackType
+from typing import TYPE_CHECKING
 
 import pytest
 from packaging.version import Version
-from rich.console import Console
 
 from deprecator._deprecator import Deprecator
 from deprecator._registry import DeprecatorRegistry, default_registry
 from deprecator._types import PackageName
-from deprecator._warnings import (
-    PerPackageDeprecationWarning,
-    PerPackageExpiredDeprecationWarning,
-    PerPackagePendingDeprecationWarning,
-    create_package_warning_classes,
+from deprecator._warnings import create_package_warning_classes
+
+if TYPE_CHECKING:
+    from click.testing import CliRunner
+    from rich.console import Console
+
+    from deprecator._warnings import WarningInstance
+
+
+# Default plugins that in-process pytester sessions never exercise: they do not
+# reuse the cache, hang, rerun failures or collect doctests
+NO_UNUSED_PLUGINS = (
+    "-p",
+    "no:cacheprovider",
+    "-p",
+    "no:faulthandler",
+    "-p",
+    "no:stepwise",
+    "-p",
+    "no:doctest",
 )
 
 
@@ -27,14 +44,53 @@ class TestVersions:
 
     PAST = Version("0.5.0")
     CURRENT = Version("1.0.0")
+    INTERMEDIATE = Version("1.5.0")
     FUTURE = Version("2.0.0")
     FAR_FUTURE = Version("3.0.0")
 
+    # Canonical string forms, for tables and asserts that need the text
+    PAST_STR = str(PAST)
+    CURRENT_STR = str(CURRENT)
+    FUTURE_STR = str(FUTURE)
+
+
+# Test deprecators for the same package and version share their warning classes
+# instead of building three new classes per fixture call
+_package_warning_classes = cache(create_package_warning_classes)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _cached_entry_points() -> Generator[None, None, None]:
+    """Memoize importlib.metadata.entry_points for the test session.
+
+    The CLI tests repeatedly scan the installed distributions for the same
+    entrypoint groups, and the environment does not change during a run.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            importlib.metadata, "entry_points", cache(importlib.metadata.entry_points)
+        )
+        yield
+
+
+@pytest.fixture(scope="session")
+def cli_runner() -> CliRunner:
+    """Click runner shared by the session; invoke() isolates stdio per call."""
+    from click.testing import CliRunner
+
+    return CliRunner()
+
+
+@pytest.fixture
+def console() -> Console:
+    """The shared test console, for calls whose output is read via capsys."""
+    return _capture_console()
+
 
 @pytest.fixture
 def test_deprecator() -> Deprecator:
     """Standard test deprecator fixture with current version."""
-    pending, deprecation, expired_warning = create_package_warning_classes(
+    pending, deprecation, expired_warning = _package_warning_classes(
         "test-package", TestVersions.CURRENT
     )
     return Deprecator(
@@ -53,54 +109,113 @@ def test_registry() -> DeprecatorRegistry:
     return DeprecatorRegistry(framework=PackageName("test"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def empty_registry() -> DeprecatorRegistry:
-    """Empty test registry fixture."""
+    """Empty test registry fixture, shared per module; tests must not mutate it."""
     return DeprecatorRegistry(framework=PackageName("test"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def populated_test_registry() -> DeprecatorRegistry:
-    """Test registry with sample deprecators already created."""
+    """Test registry with sample deprecators, shared per module; read-only."""
     registry = DeprecatorRegistry(framework=PackageName("test"))
 
     # Add a deprecator with active deprecations
     dep1 = registry.for_package(":test_package", _version=TestVersions.FUTURE)
-    dep1.define("Test deprecation message", gone_in="3.0.0", warn_in="1.5.0")
+    dep1.define(
+        "Test deprecation message",
+        gone_in=TestVersions.FAR_FUTURE,
+        warn_in=TestVersions.INTERMEDIATE,
+    )
 
     # Add another deprecator with active deprecation
-    dep2 = registry.for_package(":another_package", _version=Version("1.5.0"))
-    dep2.define("Another deprecation", gone_in="2.0.0", warn_in="1.0.0")
+    dep2 = registry.for_package(":another_package", _version=TestVersions.INTERMEDIATE)
+    dep2.define(
+        "Another deprecation",
+        gone_in=TestVersions.FUTURE,
+        warn_in=TestVersions.CURRENT,
+    )
 
     return registry
 
 
-@contextmanager
+@pytest.fixture
+def isolated_default_registry(monkeypatch: pytest.MonkeyPatch) -> DeprecatorRegistry:
+    """The default registry, emptied for the duration of one test.
+
+    Code run in-process (pytester sessions, imported examples) calls
+    for_package() on the shared default registry; without this, deprecators
+    cached by one test would leak their versions into the next.
+    """
+    monkeypatch.setattr(default_registry, "_deprecators", {})
+    return default_registry
+
+
+class _AssertWarnings:
+    """Context manager recording warnings and checking count and category on exit."""
+
+    __slots__ = ("_catcher", "_list", "expected_category", "expected_count")
+
+    def __init__(self, expected_count: int, expected_category: type[Warning]) -> None:
+        self.expected_count = expected_count
+        self.expected_category = expected_category
+
+    def __enter__(self) -> list[warnings.WarningMessage]:
+        self._catcher = warnings.catch_warnings(record=True)
+        warning_list = self._catcher.__enter__()
+        assert warning_list is not None
+        warnings.simplefilter("always")
+        self._list = warning_list
+        return warning_list
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._catcher.__exit__(exc_type, exc_value, traceback)
+        if exc_type is not None:
+            return
+
+        assert len(self._list) == self.expected_count
+        if self.expected_count > 0:
+            assert issubclass(self._list[0].category, self.expected_category)
+
+
 def assert_warnings(
     expected_count: int = 1,
     expected_category: type[Warning] = DeprecationWarning,
-) -> Generator[list[warnings.WarningMessage], None, None]:
+) -> _AssertWarnings:
     """Context manager for asserting warnings.
 
     Args:
         expected_count: Expected number of warnings
         expected_category: Expected warning category
 
-    Yields:
-        List of captured warnings
+    Returns:
+        Context manager yielding the list of captured warnings
 
     Example:
         with assert_warnings(1, DeprecationWarning) as warnings_list:
             deprecated_function()
         assert "deprecated" in str(warnings_list[0].message)
     """
-    with warnings.catch_warnings(record=True) as warning_list:
-        warnings.simplefilter("always")
-        yield warning_list
+    return _AssertWarnings(expected_count, expected_category)
+
+
+@cache
+def _capture_console() -> Console:
+    """Return the console shared by run_with_console_capture.
 
-    assert len(warning_list) == expected_count
-    if expected_count > 0:
-        assert issubclass(warning_list[0].category, expected_category)
+    Console construction probes the terminal and builds style tables, so it is
+    created once; rich is imported lazily to keep it out of rich-free runs.
+    """
+    from rich.console import Console
+
+    # Use a wide console with force_terminal to prevent text truncation in tests;
+    # without a color system or highlighting, captures are plain text
+    return Console(width=200, force_terminal=True, color_system=None, highlight=False)
 
 
 def run_with_console_capture(
@@ -125,9 +240,7 @@ def run_with_console_capture(
             warning_types=types
         )
     """
-    # Use a wide console with force_terminal to prevent text truncation in tests
-    console = Console(width=200, force_terminal=True)
-
+    console = _capture_console()
     with console.capture() as capture:
         kwargs["console"] = console
         action_func(*args, **kwargs)
@@ -135,76 +248,74 @@ def run_with_console_capture(
     return str(capture.get())
 
 
-class DeprecationTestHelper:
-    """Helper class for common deprecation testing patterns."""
-
-    @staticmethod
-    def create_pending_deprecation(
-        deprecator: Deprecator,
-        message: str = "This is pending",
-        warn_in: Version | str = TestVersions.FUTURE,
-        gone_in: Version | str = TestVersions.FAR_FUTURE,
-    ) -> (
-        PerPackageDeprecationWarning
-        | PerPackageExpiredDeprecationWarning
-        | PerPackagePendingDeprecationWarning
-    ):
-        """Create a pending deprecation warning."""
-        return deprecator.define(message, warn_in=warn_in, gone_in=gone_in)
-
-    @staticmethod
-    def create_active_deprecation(
-        deprecator: Deprecator,
-        message: str = "This is active",
-        warn_in: Version | str = TestVersions.PAST,
-        gone_in: Version | str = TestVersions.FUTURE,
-    ) -> (
-        PerPackageDeprecationWarning
-        | PerPackageExpiredDeprecationWarning
-        | PerPackagePendingDeprecationWarning
-    ):
-        """Create an active deprecation warning."""
-        return deprecator.define(message, warn_in=warn_in, gone_in=gone_in)
-
-    @staticmethod
-    def create_expired_deprecation(
-        deprecator: Deprecator,
-        message: str = "This is expired",
-        warn_in: Version | str = TestVersions.PAST,
-        gone_in: Version | str = TestVersions.CURRENT,
-    ) -> (
-        PerPackageDeprecationWarning
-        | PerPackageExpiredDeprecationWarning
-        | PerPackagePendingDeprecationWarning
-    ):
-        """Create an expired deprecation warning."""
-        return deprecator.define(message, warn_in=warn_in, gone_in=gone_in)
-
-    @staticmethod
-    def create_deprecation_with_replacement(
-        deprecator: Deprecator,
-        message: str = "This has replacement",
-        replacement: str = "new_function()",
-        warn_in: Version | str = TestVersions.PAST,
-        gone_in: Version | str = TestVersions.FUTURE,
-    ) -> (
-        PerPackageDeprecationWarning
-        | PerPackageExpiredDeprecationWarning
-        | PerPackagePendingDeprecationWarning
-    ):
-        """Create a deprecation warning with replacement."""
-        return deprecator.define(
-            message, warn_in=warn_in, gone_in=gone_in, replace_with=replacement
-        )
+# Helpers for common deprecation testing patterns
+def create_pending_deprecation(
+    deprecator: Deprecator,
+    message: str = "This is pending",
+    warn_in: Version | str = TestVersions.FUTURE,
+    gone_in: Version | str = TestVersions.FAR_FUTURE,
+) -> WarningInstance:
+    """Create a pending deprecation warning."""
+    return deprecator.define(message, warn_in=warn_in, gone_in=gone_in)
+
+
+def create_active_deprecation(
+    deprecator: Deprecator,
+    message: str = "This is active",
+    warn_in: Version | str = TestVersions.PAST,
+    gone_in: Version | str = TestVersions.FUTURE,
+) -> WarningInstance:
+    """Create an active deprecation warning."""
+    return deprecator.define(message, warn_in=warn_in, gone_in=gone_in)
+
+
+def create_expired_deprecation(
+    deprecator: Deprecator,
+    message: str = "This is expired",
+    warn_in: Version | str = TestVersions.PAST,
+    gone_in: Version | str = TestVersions.CURRENT,
+) -> WarningInstance:
+    """Create an expired deprecation warning."""
+    return deprecator.define(message, warn_in=warn_in, gone_in=gone_in)
+
+
+def create_deprecation_with_replacement(
+    deprecator: Deprecator,
+    message: str = "This has replacement",
+    replacement: str = "new_function()",
+    warn_in: Version | str = TestVersions.PAST,
+    gone_in: Version | str = TestVersions.FUTURE,
+) -> WarningInstance:
+    """Create a deprecation warning with replacement."""
+    return deprecator.define(
+        message, warn_in=warn_in, gone_in=gone_in, replace_with=replacement
+    )
+
+
+@singledispatch
+def _to_version(version: Version | str) -> Version:
+    """Coerce a test version argument to a Version, dispatching on its type."""
+    raise TypeError(f"Unsupported version type: {type(version).__name__}")
+
+
+@_to_version.register
+def _(version: Version) -> Version:
+    return version
+
+
+# Tests pass the same few version strings over and over; parse each only once
+_parse_version = cache(Version)
+
+
+@_to_version.register
+def _(version: str) -> Version:
+    return _parse_version(version)
 
 
 def get_test_deprecator(name: str, version: str | Version) -> Deprecator:
     """Factory function for creating test deprecators with custom names/versions."""
-    if isinstance(version, str):
-        version = Version(version)
-    pending, deprecation, expired_warning = create_package_warning_classes(
-        name, version
-    )
+    version = _to_version(version)
+    pending, deprecation, expired_warning = _package_warning_classes(name, version)
     return Deprecator(
         name,
         version,
@@ -215,6 +326,16 @@ def get_test_deprecator(name: str, version: str | Version) -> Deprecator:
     )
 
 
+def reset_tracked_deprecations(deprecator: Deprecator) -> Deprecator:
+    """Forget the definitions made on a shared deprecator and return it.
+
+    Fixtures that hand one deprecator to several tests call this per test, so
+    definitions made by one test are not seen by the next.
+    """
+    deprecator._tracked_deprecations.clear()
+    return deprecator
+
+
 def assert_console_output_contains(
     action_func: Callable[..., None],
     expected_texts: list[str],
@@ -263,3 +384,6 @@ def pytest_configure(config: pytest.Config) -> None:
     config.addinivalue_line(
         "markers", "warnings: mark test as testing warning emission"
     )
+    config.addinivalue_line(
+        "markers", "cli: mark test as invoking the command line interface"
+    )
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import re
+import shutil
+from importlib.metadata import PackageNotFoundError
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import click.testing
 import pytest
 from conftest import run_with_console_capture
 
@@ -12,6 +15,77 @@ from conftest import run_with_console_capture
 from deprecator._registry import DeprecatorRegistry
 from deprecator.cli import cli, print_all_deprecators, print_deprecator
 
+if TYPE_CHECKING:
+    from click.testing import CliRunner
+    from rich.console import Console
+
+pytestmark = pytest.mark.cli
+
+# Acceptable failure output of the init command, scanned in a single pass
+INIT_ERROR_RE = re.compile(r"Error:|already exists")
+
+# File contents for the init command tests, written with Path.write_bytes
+PACKAGE_INIT = b'"""Test package."""\n'
+
+PYPROJECT_MINIMAL = b"""\
+[project]
+name = "mypackage"
+version = "0.1.0"
+"""
+
+ENTRYPOINT_LINE = b'mypackage = "mypackage._deprecations:deprecator"'
+
+PYPROJECT_WITH_ENTRYPOINT = (
+    PYPROJECT_MINIMAL
+    + b"""
+[project.entry-points."deprecator.deprecator"]
+"""
+    + ENTRYPOINT_LINE
+    + b"\n"
+)
+
+EXISTING_DEPRECATIONS = b'''"""Existing deprecations."""
+
+from __future__ import annotations
+
+from deprecator import for_package
+
+# Custom deprecator setup
+deprecator = for_package(__package__)
+
+# Existing deprecation
+EXISTING_FEATURE = deprecator.define(
+    "This feature already exists and should not be lost",
+    warn_in="1.0.0",
+    gone_in="2.0.0"
+)
+'''
+
+OLD_DEPRECATIONS = b'''"""Old content that will be replaced."""
+# This should be overwritten
+OLD_DEPRECATION = None
+'''
+
+
+@pytest.fixture(scope="session")
+def init_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Minimal package with the deprecator entrypoint, written once per session."""
+    root = tmp_path_factory.mktemp("init_template")
+    (root / "mypackage").mkdir()
+    (root / "mypackage/__init__.py").write_bytes(PACKAGE_INIT)
+    (root / "pyproject.toml").write_bytes(PYPROJECT_WITH_ENTRYPOINT)
+    return root
+
+
+@pytest.fixture
+def init_project(
+    init_template: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Path:
+    """Copy of the init template as the current working directory."""
+    shutil.copytree(init_template, tmp_path, dirs_exist_ok=True)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
 
 class TestPrintDeprecator:
     """Tests for print_deprecator function."""
@@ -25,14 +99,14 @@ class TestPrintDeprecator:
         assert "Deprecations for :test_package" in output
         assert "Test deprecation message" in output
 
-    def test_nonexistent_package(self, empty_registry: DeprecatorRegistry) -> None:
+    def test_nonexistent_package(
+        self, empty_registry: DeprecatorRegistry, console: Console
+    ) -> None:
         """Test printing deprecations for non-existent package."""
         # The underlying error should be a PackageNotFoundError from the registry lookup
-        import importlib.metadata
-
-        with pytest.raises(importlib.metadata.PackageNotFoundError):
-            run_with_console_capture(
-                print_deprecator, "nonexistent_package", registry=empty_registry
+        with pytest.raises(PackageNotFoundError):
+            print_deprecator(
+                "nonexistent_package", console=console, registry=empty_registry
             )
 
 
@@ -51,31 +125,36 @@ class TestPrintAllDeprecators:
         assert ":test_package" in output
         assert ":another_package" in output
 
-    def test_empty_registry(self, empty_registry: DeprecatorRegistry) -> None:
+    def test_empty_registry(
+        self,
+        empty_registry: DeprecatorRegistry,
+        console: Console,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
         """Test printing all deprecators from empty test registry."""
-        output = run_with_console_capture(
-            print_all_deprecators, registry=empty_registry
-        )
+        print_all_deprecators(console=console, registry=empty_registry)
 
         # No output expected for empty registry
-        assert output.strip() == ""
+        assert capsys.readouterr().out.strip() == ""
 
 
 class TestShowPackageCommand:
     """Tests for show-package CLI command."""
 
-    def test_with_existing_package(self) -> None:
+    def test_with_existing_package(self, cli_runner: CliRunner) -> None:
         """Test showing deprecators from an existing package."""
-        runner = click.testing.CliRunner()
-        result = runner.invoke(cli, ["show-package", "deprecator"])
+        result = cli_runner.invoke(
+            cli, ["show-package", "deprecator"], catch_exceptions=False
+        )
 
         # Should show deprecators from the deprecator package
         assert "Deprecators from package 'deprecator'" in result.output
 
-    def test_with_nonexistent_package(self) -> None:
+    def test_with_nonexistent_package(self, cli_runner: CliRunner) -> None:
         """Test showing deprecators from a non-existent package."""
-        runner = click.testing.CliRunner()
-        result = runner.invoke(cli, ["show-package", "nonexistent-package-name"])
+        result = cli_runner.invoke(
+            cli, ["show-package", "nonexistent-package-name"], catch_exceptions=False
+        )
 
         # Should show message about no deprecators found
         assert (
@@ -87,57 +166,55 @@ class TestShowPackageCommand:
 class TestValidateValidators:
     """Tests for validate_validators command."""
 
-    def test_validate_validators(self) -> None:
+    def test_validate_validators(self, cli_runner: CliRunner) -> None:
         """Test validating that known validators have entrypoints."""
-        runner = click.testing.CliRunner()
-        result = runner.invoke(cli, ["validate-validators"])
+        result = cli_runner.invoke(cli, ["validate-validators"], catch_exceptions=False)
 
         # Should pass since the deprecator package has required entrypoints
         assert result.exit_code == 0
-        assert "✔" in result.output
-        assert "All known validators have corresponding entrypoints" in result.output
+        output = result.output
+        assert "✔" in output
+        assert "All known validators have corresponding entrypoints" in output
 
 
 class TestListPackagesCommand:
     """Tests for list-packages CLI command."""
 
-    def test_list_packages(self) -> None:
+    def test_list_packages(self, cli_runner: CliRunner) -> None:
         """Test listing packages with entrypoints."""
-        runner = click.testing.CliRunner()
-        result = runner.invoke(cli, ["list-packages"])
+        result = cli_runner.invoke(cli, ["list-packages"], catch_exceptions=False)
 
         # Should show the deprecator package
         assert result.exit_code == 0
-        assert "Packages with Deprecator Entrypoints:" in result.output
-        assert "deprecator" in result.output
+        output = result.output
+        assert "Packages with Deprecator Entrypoints:" in output
+        assert "deprecator" in output
 
 
 class TestCLI:
     """Tests for the Click CLI."""
 
-    def test_cli_help(self) -> None:
+    def test_cli_help(self, cli_runner: CliRunner) -> None:
         """Test that CLI help works."""
-        runner = click.testing.CliRunner()
-        result = runner.invoke(cli, ["--help"])
+        result = cli_runner.invoke(cli, ["--help"], catch_exceptions=False)
 
         assert result.exit_code == 0
-        assert "Deprecator CLI" in result.output
-        assert "Commands:" in result.output
+        output = result.output
+        assert "Deprecator CLI" in output
+        assert "Commands:" in output
 
-    def test_show_registry_with_package(self) -> None:
+    def test_show_registry_with_package(self, cli_runner: CliRunner) -> None:
         """Test show-registry command with package name."""
-        runner = click.testing.CliRunner()
         # Test with non-existent package - should error appropriately
-        result = runner.invoke(cli, ["show-registry", "test_package"])
+        result = cli_runner.invoke(cli, ["show-registry", "test_package"])
 
         # test_package doesn't exist, so we expect a specific error
         assert result.exit_code == 2  # Configuration error
         assert "Error:" in result.output
 
-    def test_show_registry_without_package(self) -> None:
+    def test_show_registry_without_package(self, cli_runner: CliRunner) -> None:
         """Test show-registry command without package name."""
-        runner = click.testing.CliRunner()
-        result = runner.invoke(cli, ["show-registry"])
+        result = cli_runner.invoke(cli, ["show-registry"], catch_exceptions=False)
 
         # Should succeed even if no packages have deprecations
         assert result.exit_code == 0
@@ -146,172 +223,95 @@ class TestCLI:
 class TestMainFunction:
     """Tests for main CLI function behavior."""
 
-    def test_validate_package_command_success(self) -> None:
+    def test_validate_package_command_success(self, cli_runner: CliRunner) -> None:
         """Test validate-package command with existing package."""
-        runner = click.testing.CliRunner()
-        result = runner.invoke(cli, ["validate-package", "deprecator"])
+        result = cli_runner.invoke(
+            cli, ["validate-package", "deprecator"], catch_exceptions=False
+        )
 
         # Should validate the deprecator package successfully
         assert result.exit_code == 0
         assert "Validation results for package 'deprecator'" in result.output
 
-    def test_validate_package_command_failure(self) -> None:
+    def test_validate_package_command_failure(self, cli_runner: CliRunner) -> None:
         """Test validate-package command with non-existent package."""
-        runner = click.testing.CliRunner()
-        result = runner.invoke(cli, ["validate-package", "nonexistent-package"])
+        result = cli_runner.invoke(cli, ["validate-package", "nonexistent-package"])
 
         # Should fail with appropriate error
         assert result.exit_code == 1
         assert "Package 'nonexistent-package' not found" in result.output
 
-    def test_init_command(self, tmp_path: Path) -> None:
+    @pytest.mark.usefixtures("init_project")
+    def test_init_command(self, cli_runner: CliRunner) -> None:
         """Test init command creates proper structure."""
-        runner = click.testing.CliRunner()
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # Create a minimal valid package structure
-            import os
-
-            os.makedirs("mypackage")
-            with open("mypackage/__init__.py", "w") as f:
-                f.write('"""Test package."""\n')
-
-            # Create a minimal valid pyproject.toml
-            with open("pyproject.toml", "w") as f:
-                f.write("""[project]
-name = "mypackage"
-version = "0.1.0"
-
-[project.entry-points."deprecator.deprecator"]
-mypackage = "mypackage._deprecations:deprecator"
-""")
-
-            result = runner.invoke(cli, ["init"])
-
-            # Check specific outcomes
-            if result.exit_code == 0:
-                # Success - verify the file was created
-                assert os.path.exists("mypackage/_deprecations.py")
-                with open("mypackage/_deprecations.py") as f:
-                    content = f.read()
-                    assert "for_package" in content
-                    assert "deprecator" in content
-            else:
-                # If it failed, ensure it's for a valid reason
-                assert result.exit_code == 2  # Configuration error
-                # Check for meaningful error message
-                assert "Error:" in result.output or "already exists" in result.output
-
-    def test_init_command_already_setup(self, tmp_path: Path) -> None:
+        result = cli_runner.invoke(cli, ["init"])
+
+        # Check specific outcomes
+        if result.exit_code == 0:
+            # Success - the file must have been created
+            content = Path("mypackage/_deprecations.py").read_bytes()
+            assert b"for_package" in content
+            assert b"deprecator" in content
+        else:
+            # If it failed, ensure it's for a valid reason
+            assert result.exit_code == 2  # Configuration error
+            # Check for meaningful error message
+            assert INIT_ERROR_RE.search(result.output)
+
+    @pytest.mark.usefixtures("init_project")
+    def test_init_command_already_setup(self, cli_runner: CliRunner) -> None:
         """Test init command in a project that's already setup."""
-        runner = click.testing.CliRunner()
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            import os
-
-            # Create a complete package structure that's already set up
-            os.makedirs("mypackage")
-            with open("mypackage/__init__.py", "w") as f:
-                f.write('"""Test package."""\n')
-
-            # Create existing _deprecations.py file with custom content
-            existing_deprecations_content = '''"""Existing deprecations."""
-
-from __future__ import annotations
-
-from deprecator import for_package
-
-# Custom deprecator setup
-deprecator = for_package(__package__)
-
-# Existing deprecation
-EXISTING_FEATURE = deprecator.define(
-    "This feature already exists and should not be lost",
-    warn_in="1.0.0",
-    gone_in="2.0.0"
-)
-'''
-            with open("mypackage/_deprecations.py", "w") as f:
-                f.write(existing_deprecations_content)
+        # Complete the template package structure so it's already set up
+        Path("mypackage/_deprecations.py").write_bytes(EXISTING_DEPRECATIONS)
 
-            # Create pyproject.toml with entrypoint already configured
-            with open("pyproject.toml", "w") as f:
-                f.write("""[project]
-name = "mypackage"
-version = "0.1.0"
+        # Run init command - should handle existing setup gracefully
+        result = cli_runner.invoke(cli, ["init"], input="n\n")  # Don't overwrite
 
-[project.entry-points."deprecator.deprecator"]
-mypackage = "mypackage._deprecations:deprecator"
-""")
+        # Should succeed and recognize existing setup
+        assert result.exit_code == 0
+        assert "already exists" in result.output
 
-            # Run init command - should handle existing setup gracefully
-            result = runner.invoke(cli, ["init"], input="n\n")  # Don't overwrite
+        # Verify existing file wasn't overwritten (since we said no)
+        content = Path("mypackage/_deprecations.py").read_bytes()
+        assert b"EXISTING_FEATURE" in content
+        assert b"This feature already exists" in content
 
-            # Should succeed and recognize existing setup
-            assert result.exit_code == 0
-            assert "already exists" in result.output
+        # Verify entrypoint is still there
+        content = Path("pyproject.toml").read_bytes()
+        assert b"deprecator.deprecator" in content
+        assert ENTRYPOINT_LINE in content
 
-            # Verify existing file wasn't overwritten (since we said no)
-            with open("mypackage/_deprecations.py") as f:
-                content = f.read()
-                assert "EXISTING_FEATURE" in content
-                assert "This feature already exists" in content
+    @pytest.mark.usefixtures("init_project")
+    def test_init_command_already_setup_overwrite(self, cli_runner: CliRunner) -> None:
+        """Test init command overwrites when user confirms."""
+        Path("mypackage/_deprecations.py").write_bytes(OLD_DEPRECATIONS)
+        # pyproject.toml without entrypoint (to test it gets added)
+        Path("pyproject.toml").write_bytes(PYPROJECT_MINIMAL)
 
-            # Verify entrypoint is still there
-            with open("pyproject.toml") as f:
-                content = f.read()
-                assert "deprecator.deprecator" in content
-                assert 'mypackage = "mypackage._deprecations:deprecator"' in content
+        # Run init command and confirm overwrite
+        result = cli_runner.invoke(cli, ["init"], input="y\n")  # Yes, overwrite
 
-    def test_init_command_already_setup_overwrite(self, tmp_path: Path) -> None:
-        """Test init command overwrites when user confirms."""
-        runner = click.testing.CliRunner()
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            import os
+        # Should succeed
+        assert result.exit_code == 0
+        assert "already exists" in result.output
 
-            # Create a complete package structure that's already set up
-            os.makedirs("mypackage")
-            with open("mypackage/__init__.py", "w") as f:
-                f.write('"""Test package."""\n')
+        # Verify file was overwritten with new content
+        content = Path("mypackage/_deprecations.py").read_bytes()
+        assert b"OLD_DEPRECATION" not in content  # Old content gone
+        assert b"Old content" not in content
+        assert b"EXAMPLE_DEPRECATION" in content  # New template content
+        assert b"for_package" in content
 
-            # Create existing _deprecations.py file with custom content
-            existing_content = '''"""Old content that will be replaced."""
-# This should be overwritten
-OLD_DEPRECATION = None
-'''
-            with open("mypackage/_deprecations.py", "w") as f:
-                f.write(existing_content)
+        # Verify entrypoint was added
+        content = Path("pyproject.toml").read_bytes()
+        assert b"deprecator.deprecator" in content
+        assert ENTRYPOINT_LINE in content
 
-            # Create pyproject.toml without entrypoint (to test it gets added)
-            with open("pyproject.toml", "w") as f:
-                f.write("""[project]
-name = "mypackage"
-version = "0.1.0"
-""")
-
-            # Run init command and confirm overwrite
-            result = runner.invoke(cli, ["init"], input="y\n")  # Yes, overwrite
-
-            # Should succeed
-            assert result.exit_code == 0
-            assert "already exists" in result.output
-
-            # Verify file was overwritten with new content
-            with open("mypackage/_deprecations.py") as f:
-                content = f.read()
-                assert "OLD_DEPRECATION" not in content  # Old content gone
-                assert "Old content" not in content
-                assert "EXAMPLE_DEPRECATION" in content  # New template content
-                assert "for_package" in content
-
-            # Verify entrypoint was added
-            with open("pyproject.toml") as f:
-                content = f.read()
-                assert "deprecator.deprecator" in content
-                assert 'mypackage = "mypackage._deprecations:deprecator"' in content
-
-    def test_show_registry_with_valid_package(self) -> None:
+    def test_show_registry_with_valid_package(self, cli_runner: CliRunner) -> None:
         """Test show-registry with a package that exists and has deprecations."""
-        runner = click.testing.CliRunner()
-        result = runner.invoke(cli, ["show-registry", "deprecator"])
+        result = cli_runner.invoke(
+            cli, ["show-registry", "deprecator"], catch_exceptions=False
+        )
 
         # Should succeed and show deprecator's deprecations
         assert result.exit_code == 0
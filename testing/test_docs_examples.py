@@ -3,144 +3,97 @@
 This module verifies that the example code in docs/examples/ works correctly.
 """
 
-import subprocess
+from __future__ import annotations
+
+import importlib
 import sys
+import warnings
+from collections.abc import Generator
 from pathlib import Path
 
 import pytest
+from conftest import NO_UNUSED_PLUGINS
 
+from deprecator._registry import DeprecatorRegistry
 
-@pytest.fixture
-def examples_dir() -> Path:
-    """Get the path to the docs/examples directory."""
-    return Path(__file__).parent.parent / "docs" / "examples"
-
-
-def run_python(
-    *args: str,
-    code: str | None = None,
-    cwd: Path | None = None,
-    expect_success: bool = True,
-    capture_warnings: bool = True,
-) -> subprocess.CompletedProcess[str]:
-    """Run Python code or module with common settings.
-
-    Args:
-        *args: Command-line arguments to pass to Python
-        code: Python code to run with -c (mutually exclusive with module args)
-        cwd: Working directory for the subprocess
-        expect_success: Whether to assert the process succeeds (returncode == 0)
-        capture_warnings: Whether to include -W always flag
-
-    Returns:
-        The completed process result
-
-    Raises:
-        AssertionError: If expect_success=True and the process fails
-    """
-    cmd = [sys.executable]
+EXAMPLES_DIR = Path(__file__).parent.parent / "docs" / "examples"
 
-    if capture_warnings:
-        cmd.extend(["-W", "always"])
 
-    if code is not None:
-        cmd.extend(["-c", code])
-    else:
-        cmd.extend(args)
+@pytest.fixture
+def forget_example_modules(
+    isolated_default_registry: DeprecatorRegistry,
+) -> Generator[None, None, None]:
+    """Run against a fresh default registry and forget example modules afterwards.
 
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        cwd=cwd,
-    )
+    The examples register "mypackage" with different versions, so each test
+    gets its own registry and a clean import of the examples.
+    """
+    yield
+    for name, module in list(sys.modules.items()):
+        if Path(getattr(module, "__file__", None) or "").parent == EXAMPLES_DIR:
+            del sys.modules[name]
 
-    if expect_success:
-        assert result.returncode == 0, (
-            f"Command failed with exit code {result.returncode}:\n"
-            f"stdout: {result.stdout}\n"
-            f"stderr: {result.stderr}"
-        )
 
-    return result
+@pytest.fixture
+def examples_dir(monkeypatch: pytest.MonkeyPatch, forget_example_modules: None) -> Path:
+    """Make docs/examples importable for the duration of a test."""
+    monkeypatch.syspath_prepend(EXAMPLES_DIR)
+    return EXAMPLES_DIR
 
 
 class TestExampleTests:
     """Run the existing test files in docs/examples/."""
 
-    def test_test_deprecation_py(self, examples_dir: Path) -> None:
-        """Run test_deprecation.py which tests basic_deprecation.py."""
-        result = run_python(
-            "-m",
-            "pytest",
+    @pytest.mark.parametrize(
+        "test_file",
+        [
+            # tests basic_deprecation.py
             "test_deprecation.py",
-            "-xvs",
-            cwd=examples_dir,
-            capture_warnings=False,
-        )
-        assert "2 passed" in result.stdout
-
-    def test_complete_test_py(self, examples_dir: Path) -> None:
-        """Run complete_test.py which tests decorator_usage.py and package_setup.py."""
-        result = run_python(
-            "-m",
-            "pytest",
+            # tests decorator_usage.py and package_setup.py
             "complete_test.py",
-            "-xvs",
-            cwd=examples_dir,
-            capture_warnings=False,
-        )
-        assert "2 passed" in result.stdout
+        ],
+    )
+    def test_example_test_file(
+        self,
+        forget_example_modules: None,
+        pytester: pytest.Pytester,
+        test_file: str,
+    ) -> None:
+        """Run an example test file in-process."""
+        result = pytester.runpytest(*NO_UNUSED_PLUGINS, EXAMPLES_DIR / test_file)
+        result.assert_outcomes(passed=2)
 
 
 class TestMissingExamples:
     """Test the examples that don't have dedicated test files."""
 
     def test_manual_warning_example(self, examples_dir: Path) -> None:
-        """Test manual_warning.py by running it with different parameters."""
+        """Test manual_warning.py with both code paths."""
+        manual_warning = importlib.import_module("manual_warning")
+
         # Test with old logic (should warn)
-        result = run_python(
-            code="""
-from manual_warning import complex_deprecation
-result = complex_deprecation(use_old_logic=True)
-assert result == "old result"
-""",
-            cwd=examples_dir,
-        )
-        assert "old_feature is deprecated" in result.stderr
+        with pytest.warns(DeprecationWarning, match="old_feature is deprecated"):
+            result = manual_warning.complex_deprecation(use_old_logic=True)
+        assert result == "old result"
 
         # Test with new logic (should not warn)
-        result = run_python(
-            code="""
-from manual_warning import complex_deprecation
-result = complex_deprecation(use_old_logic=False)
-assert result == "new result"
-""",
-            cwd=examples_dir,
-        )
-        assert "old_feature is deprecated" not in result.stderr
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            result = manual_warning.complex_deprecation(use_old_logic=False)
+        assert result == "new result"
 
     def test_class_deprecation_example(self, examples_dir: Path) -> None:
         """Test class_deprecation.py by instantiating the classes."""
+        class_deprecation = importlib.import_module("class_deprecation")
+
         # Test LegacyProcessor (should warn)
-        result = run_python(
-            code="""
-from class_deprecation import LegacyProcessor
-obj = LegacyProcessor()
-""",
-            cwd=examples_dir,
-        )
-        assert "old_feature is deprecated" in result.stderr
+        with pytest.warns(DeprecationWarning, match="old_feature is deprecated"):
+            class_deprecation.LegacyProcessor()
 
         # Test ModernProcessor (should not warn)
-        result = run_python(
-            code="""
-from class_deprecation import ModernProcessor
-obj = ModernProcessor()
-""",
-            cwd=examples_dir,
-        )
-        assert "old_feature is deprecated" not in result.stderr
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            class_deprecation.ModernProcessor()
 
 
 class TestPackageSetup:
@@ -148,16 +101,11 @@ class TestPackageSetup:
 
     def test_package_setup_defines_deprecations(self, examples_dir: Path) -> None:
         """Verify package_setup.py defines the expected deprecations."""
-        result = run_python(
-            code="""
-from package_setup import OLD_FEATURE_DEPRECATION, PROCESS_DATA_DEPRECATION
-expected1 = "old_feature is deprecated, use new_feature instead"
-expected2 = "process_data() is deprecated, use transform_data() instead"
-assert str(OLD_FEATURE_DEPRECATION) == expected1
-assert str(PROCESS_DATA_DEPRECATION) == expected2
-print("Package setup verified")
-""",
-            cwd=examples_dir,
-            capture_warnings=False,
+        package_setup = importlib.import_module("package_setup")
+
+        assert str(package_setup.OLD_FEATURE_DEPRECATION) == (
+            "old_feature is deprecated, use new_feature instead"
+        )
+        assert str(package_setup.PROCESS_DATA_DEPRECATION) == (
+            "process_data() is deprecated, use transform_data() instead"
         )
-        assert "Package setup verified" in result.stdout
@@ -17,17 +17,26 @@ from deprecator._init_command import (
 )
 
 
-def test_read_pyproject_toml(tmp_path: Path) -> None:
-    """Test reading and parsing pyproject.toml."""
-    pyproject_path = tmp_path / "pyproject.toml"
-    pyproject_path.write_text("""
+@pytest.fixture(scope="session")
+def quiet_console() -> Console:
+    """Non-interactive console shared by the init tests; output is discarded."""
+    return Console(quiet=True, force_terminal=False, force_interactive=False)
+
+
+SETUPTOOLS_PYPROJECT = """
 [project]
 name = "test-package"
 version = "0.1.0"
 
 [tool.setuptools]
 packages = ["test_package"]
-""")
+"""
+
+
+def test_read_pyproject_toml(tmp_path: Path) -> None:
+    """Test reading and parsing pyproject.toml."""
+    pyproject_path = tmp_path / "pyproject.toml"
+    pyproject_path.write_text(SETUPTOOLS_PYPROJECT)
 
     data = read_pyproject_toml(pyproject_path)
     assert data is not None
@@ -42,20 +51,13 @@ def test_read_pyproject_toml_not_found(tmp_path: Path) -> None:
     assert data is None
 
 
-def test_get_package_info(tmp_path: Path) -> None:
+def test_get_package_info() -> None:
     """Test extracting package info from pyproject data."""
-    pyproject_path = tmp_path / "pyproject.toml"
-    pyproject_path.write_text("""
-[project]
-name = "test-package"
-version = "0.1.0"
-
-[tool.setuptools]
-packages = ["test_package"]
-""")
-
-    data = read_pyproject_toml(pyproject_path)
-    assert data is not None
+    # Parsing is covered by test_read_pyproject_toml; pass the parsed form
+    data = {
+        "project": {"name": "test-package", "version": "0.1.0"},
+        "tool": {"setuptools": {"packages": ["test_package"]}},
+    }
 
     package_info = get_package_info(data)
     assert package_info is not None
@@ -64,18 +66,9 @@ packages = ["test_package"]
     assert import_name == "test_package"
 
 
-def test_get_package_info_hyphenated_name(tmp_path: Path) -> None:
+def test_get_package_info_hyphenated_name() -> None:
     """Test package info extraction with hyphenated package name."""
-    pyproject = tmp_path / "pyproject.toml"
-    pyproject.write_text("""
-[project]
-name = "my-hyphenated-package"
-""")
-
-    data = read_pyproject_toml(pyproject)
-    assert data is not None
-
-    package_info = get_package_info(data)
+    package_info = get_package_info({"project": {"name": "my-hyphenated-package"}})
     assert package_info is not None
     package_name, import_name = package_info
     assert package_name == "my-hyphenated-package"
@@ -101,14 +94,7 @@ def test_create_deprecations_module() -> None:
 def test_add_entrypoint_to_pyproject(tmp_path: Path) -> None:
     """Test adding entrypoint to pyproject.toml."""
     pyproject_path = tmp_path / "pyproject.toml"
-    pyproject_path.write_text("""
-[project]
-name = "test-package"
-version = "0.1.0"
-
-[tool.setuptools]
-packages = ["test_package"]
-""")
+    pyproject_path.write_text(SETUPTOOLS_PYPROJECT)
 
     # Add entrypoint
     success = add_entrypoint_to_pyproject(
@@ -152,33 +138,25 @@ something = "module:attr"
 
 
 def test_init_deprecator_full_flow(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    quiet_console: Console,
 ) -> None:
     """Test the full init_deprecator flow."""
     # Create project structure
     pyproject_path = tmp_path / "pyproject.toml"
-    pyproject_path.write_text("""
-[project]
-name = "test-package"
-version = "0.1.0"
-
-[tool.setuptools]
-packages = ["test_package"]
-""")
+    pyproject_path.write_text(SETUPTOOLS_PYPROJECT)
 
     # Create package directory
     package_dir = tmp_path / "test_package"
     package_dir.mkdir()
-    (package_dir / "__init__.py").write_text("")
+    (package_dir / "__init__.py").touch()
 
     # Change to the project directory
     monkeypatch.chdir(tmp_path)
 
-    # Create a console with no interactivity (for testing)
-    console = Console(force_terminal=False, force_interactive=False)
-
     # Run init
-    init_deprecator(console)
+    init_deprecator(quiet_console)
 
     # Check that _deprecations.py was created
     deprecations_file = tmp_path / "test_package" / "_deprecations.py"
@@ -195,7 +173,9 @@ packages = ["test_package"]
 
 
 def test_init_deprecator_src_layout(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    quiet_console: Console,
 ) -> None:
     """Test init with src/ layout."""
     # Create project with src layout
@@ -213,93 +193,50 @@ packages = ["test_package"]
     src_dir.mkdir()
     package_dir = src_dir / "test_package"
     package_dir.mkdir()
-    (package_dir / "__init__.py").write_text("")
+    (package_dir / "__init__.py").touch()
 
     # Change to project directory
     monkeypatch.chdir(tmp_path)
 
-    console = Console(force_terminal=False, force_interactive=False)
-    init_deprecator(console)
+    init_deprecator(quiet_console)
 
     # Check that file was created in src/test_package
     deprecations_file = src_dir / "test_package" / "_deprecations.py"
     assert deprecations_file.exists()
 
 
-def test_init_deprecator_no_pyproject(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    """Test init when pyproject.toml doesn't exist."""
-    monkeypatch.chdir(tmp_path)
-
-    console = Console(force_terminal=False, force_interactive=False)
-
-    with pytest.raises(SystemExit) as exc_info:
-        init_deprecator(console)
-
-    assert exc_info.value.code == 2
-
-
-def test_init_deprecator_invalid_pyproject(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    """Test init with invalid pyproject.toml."""
-    pyproject_path = tmp_path / "pyproject.toml"
-    pyproject_path.write_text("invalid toml {{{")
-
-    monkeypatch.chdir(tmp_path)
-
-    console = Console(force_terminal=False, force_interactive=False)
-
-    with pytest.raises(SystemExit) as exc_info:
-        init_deprecator(console)
-
-    assert exc_info.value.code == 2
-
-
-def test_init_deprecator_no_package_name(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    """Test init when package name cannot be determined."""
-    pyproject_path = tmp_path / "pyproject.toml"
-    pyproject_path.write_text("""
-[tool.something]
-value = "test"
-""")
-
-    monkeypatch.chdir(tmp_path)
-
-    console = Console(force_terminal=False, force_interactive=False)
-
-    with pytest.raises(SystemExit) as exc_info:
-        init_deprecator(console)
-
-    assert exc_info.value.code == 2
-
-
-def test_init_deprecator_package_dir_not_found(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+@pytest.mark.parametrize(
+    "pyproject_body",
+    [
+        pytest.param(None, id="no-pyproject"),
+        pytest.param("invalid toml {{{", id="invalid-pyproject"),
+        pytest.param('[tool.something]\nvalue = "test"\n', id="no-package-name"),
+        pytest.param('[project]\nname = "test-package"\n', id="package-dir-not-found"),
+    ],
+)
+def test_init_deprecator_configuration_error(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    quiet_console: Console,
+    pyproject_body: str | None,
 ) -> None:
-    """Test init when package directory doesn't exist."""
-    pyproject_path = tmp_path / "pyproject.toml"
-    pyproject_path.write_text("""
-[project]
-name = "test-package"
-""")
+    """Test init exits with a configuration error for unusable projects."""
+    if pyproject_body is not None:
+        (tmp_path / "pyproject.toml").write_text(pyproject_body)
 
     monkeypatch.chdir(tmp_path)
 
-    console = Console(force_terminal=False, force_interactive=False)
-
     with pytest.raises(SystemExit) as exc_info:
-        init_deprecator(console)
+        init_deprecator(quiet_console)
 
     assert exc_info.value.code == 2
 
 
 @pytest.mark.skipif(sys.version_info >= (3, 11), reason="Test for Python < 3.11")
 def test_init_deprecator_tomli_not_available(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    quiet_console: Console,
 ) -> None:
     """Test init when tomli is not available (Python < 3.11)."""
     # Mock tomli import to fail
@@ -322,9 +259,7 @@ name = "test-package"
 
     monkeypatch.chdir(tmp_path)
 
-    console = Console(force_terminal=False, force_interactive=False)
-
     with pytest.raises(SystemExit) as exc_info:
-        init_deprecator(console)
+        init_deprecator(quiet_console)
 
     assert exc_info.value.code == 2
@@ -3,8 +3,6 @@
 
 from __future__ import annotations
 
-import warnings
-
 import pytest
 
 from deprecator import deprecate
@@ -22,14 +20,13 @@ class TestDeprecate:
         def old_function() -> str:
             return "hello"
 
-        with warnings.catch_warnings(record=True) as warning_list:
-            warnings.simplefilter("always")
+        with pytest.warns(
+            DeprecationWarning, match="old_function is deprecated"
+        ) as warning_list:
             result = old_function()
 
         assert result == "hello"
         assert len(warning_list) == 1
-        assert issubclass(warning_list[0].category, DeprecationWarning)
-        assert "old_function is deprecated" in str(warning_list[0].message)
 
     def test_deprecate_function_with_replacement(self) -> None:
         """Test that a deprecated function with replacement shows proper warning."""
@@ -41,13 +38,11 @@ class TestDeprecate:
         def old_function() -> str:
             return "old hello"
 
-        with warnings.catch_warnings(record=True) as warning_list:
-            warnings.simplefilter("always")
+        with pytest.warns(DeprecationWarning) as warning_list:
             result = old_function()
 
         assert result == "old hello"
         assert len(warning_list) == 1
-        assert issubclass(warning_list[0].category, DeprecationWarning)
         warning_msg = str(warning_list[0].message)
         assert "old_function is deprecated" in warning_msg
         assert "use new_function instead" in warning_msg
@@ -59,8 +54,7 @@ class TestDeprecate:
         def old_function(a: int, b: str, c: bool = True) -> tuple[int, str, bool]:
             return a, b, c
 
-        with warnings.catch_warnings(record=True):
-            warnings.simplefilter("always")
+        with pytest.warns(DeprecationWarning):
             result = old_function(42, "test", c=False)
 
         assert result == (42, "test", False)
@@ -104,8 +98,7 @@ class TestDeprecate:
         def returns_value() -> int:
             return 123
 
-        with warnings.catch_warnings(record=True):
-            warnings.simplefilter("always")
+        with pytest.warns(DeprecationWarning):
             result = returns_value()
 
         assert result == 123
@@ -117,10 +110,11 @@ class TestDeprecate:
         def raises_exception() -> None:
             raise ValueError("test error")
 
-        with warnings.catch_warnings(record=True):
-            warnings.simplefilter("always")
-            with pytest.raises(ValueError, match="test error"):
-                raises_exception()
+        with (
+            pytest.warns(DeprecationWarning),
+            pytest.raises(ValueError, match="test error"),
+        ):
+            raises_exception()
 
     def test_multiple_calls_show_multiple_warnings(self) -> None:
         """Test that each call to deprecated function shows a warning."""
@@ -129,14 +123,14 @@ class TestDeprecate:
         def old_function() -> None:
             pass
 
-        with warnings.catch_warnings(record=True) as warning_list:
-            warnings.simplefilter("always")
+        def call_twice() -> None:
             old_function()
             old_function()
 
+        # both calls must warn within one recording scope
+        with pytest.warns(DeprecationWarning) as warning_list:
+            call_twice()
         assert len(warning_list) == 2
-        for warning in warning_list:
-            assert issubclass(warning.category, DeprecationWarning)
 
     def test_deprecate_class_method(self) -> None:
         """Test deprecating a class method."""
@@ -148,13 +142,13 @@ class TestDeprecate:
 
         instance = TestClass()
 
-        with warnings.catch_warnings(record=True) as warning_list:
-            warnings.simplefilter("always")
+        with pytest.warns(
+            DeprecationWarning, match="old_method is deprecated"
+        ) as warning_list:
             result = instance.old_method()
 
         assert result == "method result"
         assert len(warning_list) == 1
-        assert "old_method is deprecated" in str(warning_list[0].message)
 
     def test_deprecate_static_method(self) -> None:
         """Test deprecating a static method."""
@@ -165,13 +159,13 @@ class TestDeprecate:
             def old_static_method() -> str:
                 return "static result"
 
-        with warnings.catch_warnings(record=True) as warning_list:
-            warnings.simplefilter("always")
+        with pytest.warns(
+            DeprecationWarning, match="old_static_method is deprecated"
+        ) as warning_list:
             result = TestClass.old_static_method()
 
         assert result == "static result"
         assert len(warning_list) == 1
-        assert "old_static_method is deprecated" in str(warning_list[0].message)
 
     def test_replacement_object_must_have_name_attribute(self) -> None:
         """Test that replacement objects must have a __name__ attribute."""
@@ -185,12 +179,9 @@ class TestDeprecate:
         def old_function() -> None:
             pass
 
-        with warnings.catch_warnings(record=True) as warning_list:
-            warnings.simplefilter("always")
+        with pytest.warns(DeprecationWarning, match="use replacement_name instead"):
             old_function()
 
-        assert "use replacement_name instead" in str(warning_list[0].message)
-
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -2,106 +2,117 @@
 
 from __future__ import annotations
 
-import pytest
-
-
-def test_expired_deprecation_causes_session_failure(pytester: pytest.Pytester) -> None:
-    """Test that expired deprecations cause session failure."""
-    # Create a test file with an expired deprecation
-    pytester.makepyfile("""
-        from deprecator import for_package
-        from packaging.version import Version
-
-        def test_expired_warning():
-            deprecator = for_package("test-package", _version=Version("2.0.0"))
-            expired_warning = deprecator.define(
-                "This is expired",
-                warn_in="1.0.0",
-                gone_in="1.5.0"
-            )
-            expired_warning.warn()
-    """)
+import warnings
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import cast
 
-    # Run pytest and check that session fails due to expired deprecation
-    result = pytester.runpytest("-v")
-    result.assert_outcomes(passed=1)
-    # The test itself passes but session should fail due to expired deprecation
-    assert result.ret == pytest.ExitCode.TESTS_FAILED
-
-
-def test_expired_deprecation_with_error_flag_causes_test_failure(
-    pytester: pytest.Pytester,
+import pytest
+from conftest import (
+    NO_UNUSED_PLUGINS,
+    create_active_deprecation,
+    create_expired_deprecation,
+    create_pending_deprecation,
+)
+
+from deprecator._deprecator import Deprecator
+from deprecator._pytest_plugin import DeprecatorPlugin
+from deprecator._warnings import WarningInstance
+
+# Inner sessions run in-process and register their deprecators on the default
+# registry, so every test here starts from an empty one
+pytestmark = pytest.mark.usefixtures("isolated_default_registry")
+
+# Nobody reads the inner sessions' header; their single module imports nothing
+# local, so it needs no sys.path insertion
+FAST_ARGS = (
+    *NO_UNUSED_PLUGINS,
+    "--no-header",
+    "-q",
+    "--import-mode=importlib",
+)
+
+
+def run_inner_session(pytester: pytest.Pytester, *args: str) -> pytest.RunResult:
+    """Run a pytester session in-process with the startup extras disabled."""
+    return pytester.runpytest(*FAST_ARGS, *args)
+
+
+SINGLE_WARNING_TEST = """
+from deprecator import for_package
+from packaging.version import Version
+
+def test_warning():
+    deprecator = for_package({package!r}, _version=Version({current!r}))
+    warning = deprecator.define(
+        "This is a deprecation",
+        warn_in={warn_in!r},
+        gone_in={gone_in!r}
+    )
+    warning.warn()
+"""
+
+
+def write_single_warning_test(
+    pytester: pytest.Pytester, package: str, current: str, warn_in: str, gone_in: str
 ) -> None:
-    """Test that expired deprecations cause test failure with --deprecator-error."""
-    # Create a test file with an expired deprecation
-    pytester.makepyfile("""
-        from deprecator import for_package
-        from packaging.version import Version
-
-        def test_expired_warning():
-            deprecator = for_package("test-package", _version=Version("2.0.0"))
-            expired_warning = deprecator.define(
-                "This is expired",
-                warn_in="1.0.0",
-                gone_in="1.5.0"
-            )
-            expired_warning.warn()
-    """)
+    """Write a test module that defines and emits one deprecation."""
+    pytester.makepyfile(
+        SINGLE_WARNING_TEST.format(
+            package=package, current=current, warn_in=warn_in, gone_in=gone_in
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    ("args", "outcomes"),
+    [
+        # The test itself passes but the session fails due to the expiry
+        pytest.param((), {"passed": 1}, id="expired-fails-session"),
+        pytest.param(
+            ("--deprecator-error",),
+            {"failed": 1},
+            id="expired-with-error-flag-fails-test",
+        ),
+    ],
+)
+def test_expired_deprecation_outcome(
+    pytester: pytest.Pytester, args: tuple[str, ...], outcomes: dict[str, int]
+) -> None:
+    """Test how expired deprecations fail the session end to end."""
+    write_single_warning_test(
+        pytester, "test-package", current="2.0.0", warn_in="1.0.0", gone_in="1.5.0"
+    )
 
-    # Run pytest with --deprecator-error flag
-    result = pytester.runpytest("-v", "--deprecator-error")
-    result.assert_outcomes(failed=1)
+    result = run_inner_session(pytester, *args)
+    result.assert_outcomes(**outcomes)
     assert result.ret == pytest.ExitCode.TESTS_FAILED
 
 
-def test_active_deprecation_does_not_cause_failure(pytester: pytest.Pytester) -> None:
-    """Test that active deprecations do not cause failures."""
-    # Create a test file with an active deprecation
-    pytester.makepyfile("""
-        from deprecator import for_package
-        from packaging.version import Version
-
-        def test_active_warning():
-            deprecator = for_package(
-                "test-package-active", _version=Version("1.2.0")
-            )
-            active_warning = deprecator.define(
-                "This is active",
-                warn_in="1.0.0",
-                gone_in="2.0.0"
-            )
-            active_warning.warn()
-    """)
-
-    # Run pytest - should pass normally
-    result = pytester.runpytest("-v")
-    result.assert_outcomes(passed=1)
-    assert result.ret == pytest.ExitCode.OK
-
-
-def test_pending_deprecation_does_not_cause_failure(pytester: pytest.Pytester) -> None:
-    """Test that pending deprecations do not cause failures."""
-    # Create a test file with a pending deprecation
-    pytester.makepyfile("""
-        from deprecator import for_package
-        from packaging.version import Version
-
-        def test_pending_warning():
-            deprecator = for_package(
-                "test-package-pending", _version=Version("0.5.0")
-            )
-            pending_warning = deprecator.define(
-                "This is pending",
-                warn_in="1.0.0",
-                gone_in="2.0.0"
-            )
-            pending_warning.warn()
-    """)
+@pytest.mark.parametrize(
+    ("create_deprecation", "exitstatus"),
+    [
+        (create_pending_deprecation, pytest.ExitCode.OK),
+        (create_active_deprecation, pytest.ExitCode.OK),
+        (create_expired_deprecation, pytest.ExitCode.TESTS_FAILED),
+    ],
+    ids=["pending", "active", "expired"],
+)
+def test_plugin_session_outcome(
+    test_deprecator: Deprecator,
+    create_deprecation: Callable[[Deprecator], WarningInstance],
+    exitstatus: pytest.ExitCode,
+) -> None:
+    """Test that only recorded expired deprecations fail the session."""
+    plugin = DeprecatorPlugin(show_github_annotations=False)
+    warning = create_deprecation(test_deprecator)
+    plugin.pytest_warning_recorded(
+        warnings.WarningMessage(warning, type(warning), __file__, 1)
+    )
 
-    # Run pytest - should pass normally
-    result = pytester.runpytest("-v")
-    result.assert_outcomes(passed=1)
-    assert result.ret == pytest.ExitCode.OK
+    session = SimpleNamespace(exitstatus=pytest.ExitCode.OK)
+    plugin.pytest_sessionfinish(cast(pytest.Session, session))
+    assert session.exitstatus == exitstatus
 
 
 def test_github_annotations_flag_outputs_warnings(pytester: pytest.Pytester) -> None:
@@ -132,13 +143,14 @@ def test_github_annotations_flag_outputs_warnings(pytester: pytest.Pytester) ->
     """)
 
     # Run pytest with GitHub annotations flag
-    result = pytester.runpytest("-v", "--deprecator-github-annotations")
+    result = run_inner_session(pytester, "--deprecator-github-annotations")
 
     # Check that GitHub annotations are in the output
-    assert "::warning" in result.stdout.str()
-    assert "::error" in result.stdout.str()
-    assert "This is pending" in result.stdout.str()
-    assert "This is expired" in result.stdout.str()
+    out = result.stdout.str()
+    assert "::warning" in out
+    assert "::error" in out
+    assert "This is pending" in out
+    assert "This is expired" in out
 
 
 def test_github_annotations_auto_enabled_in_github_actions(
@@ -146,51 +158,28 @@ def test_github_annotations_auto_enabled_in_github_actions(
 ) -> None:
     """Test that GitHub annotations are auto-enabled in GitHub Actions CI."""
     # Create a test file with a pending deprecation
-    pytester.makepyfile("""
-        from deprecator import for_package
-        from packaging.version import Version
-
-        def test_pending_warning():
-            deprecator = for_package("test-package", _version=Version("0.5.0"))
-            pending_warning = deprecator.define(
-                "This is pending",
-                warn_in="1.0.0",
-                gone_in="2.0.0"
-            )
-            pending_warning.warn()
-    """)
+    write_single_warning_test(pytester, "test-package", "0.5.0", "1.0.0", "2.0.0")
 
     monkeypatch.setenv("GITHUB_ACTIONS", "true")
     # Run pytest with GitHub Actions environment variable set
-    result = pytester.runpytest_subprocess("-v", "--deprecator-github-annotations")
+    result = run_inner_session(pytester, "--deprecator-github-annotations")
 
     # Check that GitHub annotations are in the output
     result.stdout.fnmatch_lines([
         "::warning file=*/test_github_annotations_auto_enabled_in_github_actions.py"
-        ",line=11,title=deprecation::This is pending"
+        ",line=11,title=deprecation::This is a deprecation"
     ])
 
 
 def test_no_github_annotations_without_flag_or_ci(pytester: pytest.Pytester) -> None:
     """Test that no GitHub annotations are output without flag or CI environment."""
     # Create a test file with a pending deprecation
-    pytester.makepyfile("""
-        from deprecator import for_package
-        from packaging.version import Version
-
-        def test_pending_warning():
-            deprecator = for_package("test-package", _version=Version("0.5.0"))
-            pending_warning = deprecator.define(
-                "This is pending",
-                warn_in="1.0.0",
-                gone_in="2.0.0"
-            )
-            pending_warning.warn()
-    """)
+    write_single_warning_test(pytester, "test-package", "0.5.0", "1.0.0", "2.0.0")
 
     # Run pytest without any special flags or CI environment
-    result = pytester.runpytest("-v")
+    result = run_inner_session(pytester)
 
     # Check that no GitHub annotations are in the output
-    assert "::warning" not in result.stdout.str()
-    assert "::error" not in result.stdout.str()
+    out = result.stdout.str()
+    assert "::warning" not in out
+    assert "::error" not in out
@@ -27,7 +27,7 @@ def test_deprecator_registry_for_package(registry: DeprecatorRegistry) -> None:
     deprecator1 = registry.for_package(package_name, _version=TestVersions.CURRENT)
     assert isinstance(deprecator1, Deprecator)
     assert deprecator1.name == PackageName(package_name)
-    assert deprecator1.current_version == Version("1.0.0")
+    assert deprecator1.current_version == TestVersions.CURRENT
 
     # Second call with same package should return the same instance
     deprecator2 = registry.for_package(package_name, _version=TestVersions.CURRENT)
@@ -41,7 +41,7 @@ def test_deprecator_registry_for_package(registry: DeprecatorRegistry) -> None:
     ):
         deprecator3 = registry.for_package(package_name, _version=Version("1.1.0"))
     assert deprecator1 is deprecator3
-    assert deprecator3.current_version == Version("1.0.0")
+    assert deprecator3.current_version == TestVersions.CURRENT
 
 
 def test_default_registry_exists() -> None:
@@ -167,13 +167,13 @@ def test_colon_prefixed_package_handling() -> None:
     )
     assert isinstance(test_deprecator, Deprecator)
     assert test_deprecator.name == PackageName(":test-package")
-    assert test_deprecator.current_version == Version("1.0.0")
+    assert test_deprecator.current_version == TestVersions.CURRENT
 
     # Should also work with explicit version
     test_deprecator_v2 = registry.for_package(
-        ":another-test", _version=Version("2.0.0")
+        ":another-test", _version=TestVersions.FUTURE
     )
-    assert test_deprecator_v2.current_version == Version("2.0.0")
+    assert test_deprecator_v2.current_version == TestVersions.FUTURE
 
 
 def test_colon_prefixed_package_requires_version() -> None:
@@ -199,9 +199,9 @@ def test_registry_parameter_consistency() -> None:
     registry = DeprecatorRegistry(framework=PackageName(":test_framework"))
 
     # Both should accept _version parameter consistently
-    deprecator1 = registry.for_package(":test1", _version=Version("1.0.0"))
-    assert deprecator1.current_version == Version("1.0.0")
+    deprecator1 = registry.for_package(":test1", _version=TestVersions.CURRENT)
+    assert deprecator1.current_version == TestVersions.CURRENT
 
     # Deprecator.for_package should also use _version
-    deprecator2 = Deprecator.for_package(":test2", _version=Version("2.0.0"))
-    assert deprecator2.current_version == Version("2.0.0")
+    deprecator2 = Deprecator.for_package(":test2", _version=TestVersions.FUTURE)
+    assert deprecator2.current_version == TestVersions.FUTURE
@@ -5,261 +5,198 @@ from __future__ import annotations
 import pytest
 from conftest import (
     get_test_deprecator,
+    reset_tracked_deprecations,
     run_with_console_capture,
 )
 from rich.table import Table
 
+from deprecator._deprecator import Deprecator
+from deprecator._registry import DeprecatorRegistry
 from deprecator._rich_display import (
     _get_warning_type_display_name,
     create_deprecations_table,
     print_deprecations_table,
 )
+from deprecator._types import PackageName
 from deprecator.ux import get_warning_types, print_deprecations
 
+# The filter selections the tests use, built once
+PENDING_ONLY = get_warning_types(pending=True, active=False, expired=False)
+ACTIVE_AND_EXPIRED = get_warning_types(pending=False, active=True, expired=True)
+ALL_TYPES = get_warning_types(pending=True, active=True, expired=True)
+
+
+@pytest.fixture(scope="module")
+def _shared_deprecator_v1_0() -> Deprecator:
+    return get_test_deprecator("test-package", "1.0.0")
+
+
+@pytest.fixture(scope="module")
+def _shared_deprecator_v1_5() -> Deprecator:
+    return get_test_deprecator("test-package", "1.5.0")
+
+
+@pytest.fixture
+def deprecator_v1_0(_shared_deprecator_v1_0: Deprecator) -> Deprecator:
+    """The module's "test-package" v1.0.0 deprecator, without definitions."""
+    return reset_tracked_deprecations(_shared_deprecator_v1_0)
+
+
+@pytest.fixture
+def deprecator_v1_5(_shared_deprecator_v1_5: Deprecator) -> Deprecator:
+    """The module's "test-package" v1.5.0 deprecator, without definitions."""
+    return reset_tracked_deprecations(_shared_deprecator_v1_5)
+
+
+@pytest.fixture(scope="module")
+def three_type_deprecator() -> Deprecator:
+    """A v1.5.0 deprecator with one pending, one active and one expired entry.
+
+    It is shared by the whole module, so tests must not add their own definitions.
+    """
+    deprecator = get_test_deprecator("test-package", "1.5.0")
+    deprecator.define("Pending", gone_in="3.0.0", warn_in="2.0.0")
+    deprecator.define("Active", gone_in="2.0.0", warn_in="1.0.0")
+    deprecator.define("Expired", gone_in="1.0.0", warn_in="0.5.0")
+    return deprecator
+
 
 class TestCreateDeprecationsTable:
     """Test the create_deprecations_table function."""
 
-    def test_empty_deprecator(self) -> None:
+    def test_empty_deprecator(self, deprecator_v1_0: Deprecator) -> None:
         """Test with a deprecator that has no tracked deprecations."""
-        deprecator = get_test_deprecator("test-package", "1.0.0")
-
-        table = create_deprecations_table(deprecator)
+        table = create_deprecations_table(deprecator_v1_0)
 
         assert isinstance(table, Table)
         assert table.title == "Deprecations for test-package (v1.0.0)"
         assert len(table.rows) == 0
 
-    def test_custom_title(self) -> None:
+    def test_custom_title(self, deprecator_v1_0: Deprecator) -> None:
         """Test with a custom title."""
-        deprecator = get_test_deprecator("test-package", "1.0.0")
         custom_title = "My Custom Deprecations"
 
-        table = create_deprecations_table(deprecator, title=custom_title)
+        table = create_deprecations_table(deprecator_v1_0, title=custom_title)
 
         assert table.title == custom_title
 
-    def test_single_deprecation(self) -> None:
+    @pytest.mark.parametrize(
+        ("warn_in", "expected_rows"),
+        [
+            # still pending, so the default selection leaves it out
+            ("1.5.0", 0),
+            ("0.5.0", 1),
+        ],
+        ids=["pending", "active"],
+    )
+    def test_single_deprecation(
+        self, deprecator_v1_0: Deprecator, warn_in: str, expected_rows: int
+    ) -> None:
         """Test with a single tracked deprecation."""
-        deprecator = get_test_deprecator("test-package", "1.0.0")
-
-        # Create a deprecation
-        deprecator.define(
-            "This function is deprecated", gone_in="2.0.0", warn_in="1.5.0"
+        deprecator_v1_0.define(
+            "This function is deprecated", gone_in="2.0.0", warn_in=warn_in
         )
 
-        table = create_deprecations_table(deprecator)
+        table = create_deprecations_table(deprecator_v1_0)
 
-        assert len(table.rows) == 0  # no active deprecations
-        # Check that the table was created successfully
+        assert len(table.rows) == expected_rows
         assert table.title == "Deprecations for test-package (v1.0.0)"
 
-    def test_multiple_deprecations_different_types(self) -> None:
+    def test_multiple_deprecations_different_types(
+        self, three_type_deprecator: Deprecator
+    ) -> None:
         """Test with multiple deprecations of different types."""
-        deprecator = get_test_deprecator("test-package", "1.5.0")
-
-        # Pending deprecation (warn_in > current_version)
-        deprecator.define(
-            "This will be deprecated",
-            gone_in="3.0.0",
-            warn_in="2.0.0",
-        )
-
-        # Active deprecation (warn_in <= current_version < gone_in)
-        deprecator.define(
-            "This is deprecated",
-            gone_in="2.0.0",
-            warn_in="1.0.0",
-        )
-
-        # Expired deprecation (gone_in <= current_version)
-        deprecator.define(
-            "This should error",
-            gone_in="1.0.0",
-            warn_in="0.5.0",
-        )
-
-        table = create_deprecations_table(deprecator)
+        table = create_deprecations_table(three_type_deprecator)
 
+        # the default selection leaves out the pending deprecation
         assert len(table.rows) == 2
         # Verify table was created successfully with the right title
         assert table.title is not None and "test-package" in str(table.title)
 
-    def test_warning_type_filtering_single_type(self) -> None:
+    def test_warning_type_filtering_single_type(
+        self, three_type_deprecator: Deprecator
+    ) -> None:
         """Test filtering by a single warning type."""
-        deprecator = get_test_deprecator("test-package", "1.5.0")
-
-        # Create different types of deprecations
-        deprecator.define("Pending", gone_in="3.0.0", warn_in="2.0.0")
-        deprecator.define("Active", gone_in="2.0.0", warn_in="1.0.0")
-        deprecator.define("Expired", gone_in="1.0.0", warn_in="0.5.0")
-
-        # Filter for only pending warnings
         table = create_deprecations_table(
-            deprecator,
-            warning_types=get_warning_types(pending=True, active=False, expired=False),
+            three_type_deprecator, warning_types=PENDING_ONLY
         )
 
-        assert len(table.rows) == 1
+        assert list(table.columns[1].cells) == ["Pending"]
 
-    def test_warning_type_filtering_multiple_types(self) -> None:
+    def test_warning_type_filtering_multiple_types(
+        self, three_type_deprecator: Deprecator
+    ) -> None:
         """Test filtering by multiple warning types."""
-        deprecator = get_test_deprecator("test-package", "1.5.0")
-
-        # Create different types of deprecations
-        deprecator.define("Pending", gone_in="3.0.0", warn_in="2.0.0")
-        deprecator.define("Active", gone_in="2.0.0", warn_in="1.0.0")
-        deprecator.define("Expired", gone_in="1.0.0", warn_in="0.5.0")
-
-        # Filter for active warnings (deprecation + expired)
         table = create_deprecations_table(
-            deprecator,
-            warning_types=get_warning_types(pending=False, active=True, expired=True),
-        )
-
-        assert len(table.rows) == 2
-
-    def test_no_importable_name(self) -> None:
-        """Test deprecation (importable names no longer tracked)."""
-        deprecator = get_test_deprecator("test-package", "1.6.0")
-
-        deprecator.define(
-            "This deprecation works fine",
-            gone_in="2.0.0",
-            warn_in="1.5.0",
+            three_type_deprecator, warning_types=ACTIVE_AND_EXPIRED
         )
 
-        table = create_deprecations_table(deprecator)
-
-        assert len(table.rows) == 1
+        assert list(table.columns[1].cells) == ["Active", "Expired"]
 
 
 class TestPrintDeprecationsTable:
     """Test the print_deprecations_table function."""
 
-    def test_print_with_custom_console(self) -> None:
-        """Test printing with a custom console."""
-        deprecator = get_test_deprecator("test-package", "1.0.0")
-        deprecator.define("Test deprecation", gone_in="2.0.0", warn_in="1.5.0")
-
-        # Should not raise an exception and should produce output
-        output = run_with_console_capture(print_deprecations_table, deprecator)
-        assert "test-package" in output
-
-    def test_print_with_default_console(self) -> None:
+    def test_print_with_default_console(self, deprecator_v1_0: Deprecator) -> None:
         """Test printing with default console."""
-        deprecator = get_test_deprecator("test-package", "1.0.0")
-        deprecator.define("Test deprecation", gone_in="2.0.0", warn_in="1.5.0")
+        deprecator_v1_0.define("Test deprecation", gone_in="2.0.0", warn_in="1.5.0")
 
         # Should not raise an exception and should produce output
-        output = run_with_console_capture(print_deprecations_table, deprecator)
+        output = run_with_console_capture(print_deprecations_table, deprecator_v1_0)
         assert "test-package" in output
 
-    def test_print_with_filtering(self) -> None:
-        """Test printing with warning type filtering."""
-        deprecator = get_test_deprecator("test-package", "1.5.0")
-
-        deprecator.define("Pending", gone_in="3.0.0", warn_in="2.0.0")
-        deprecator.define("Active", gone_in="2.0.0", warn_in="1.0.0")
-
-        output = run_with_console_capture(
-            print_deprecations_table,
-            deprecator,
-            warning_types=get_warning_types(pending=True, active=False, expired=False),
-        )
-        assert "Pending" in output
-
 
 class TestWarningTypeDisplayName:
     """Test the _get_warning_type_display_name function."""
 
-    def test_pending_deprecation_warning(self) -> None:
-        """Test display name for pending deprecation warning."""
-        deprecator = get_test_deprecator("test-package", "1.0.0")
-        warning = deprecator.define("Test", gone_in="3.0.0", warn_in="2.0.0")
-
-        display_name = _get_warning_type_display_name(warning)
-        assert display_name == "Pending"
-
-    def test_deprecation_warning(self) -> None:
-        """Test display name for deprecation warning."""
-        deprecator = get_test_deprecator("test-package", "1.5.0")
-        warning = deprecator.define("Test", gone_in="2.0.0", warn_in="1.0.0")
-
-        display_name = _get_warning_type_display_name(warning)
-        assert display_name == "Warning"
-
-    def test_expired_deprecation_warning(self) -> None:
-        """Test display name for expired deprecation warning."""
-        deprecator = get_test_deprecator("test-package", "2.0.0")
-        warning = deprecator.define("Test", gone_in="1.5.0", warn_in="1.0.0")
-
-        display_name = _get_warning_type_display_name(warning)
-        assert display_name == "Error"
+    @pytest.mark.parametrize(
+        ("warn_in", "gone_in", "expected"),
+        [
+            ("2.0.0", "3.0.0", "Pending"),
+            ("1.0.0", "2.0.0", "Warning"),
+            ("0.5.0", "1.0.0", "Error"),
+        ],
+        ids=["pending", "deprecation", "expired"],
+    )
+    def test_display_name(
+        self,
+        deprecator_v1_5: Deprecator,
+        warn_in: str,
+        gone_in: str,
+        expected: str,
+    ) -> None:
+        """Test the display name of each warning state at version 1.5.0."""
+        warning = deprecator_v1_5.define("Test", gone_in=gone_in, warn_in=warn_in)
+
+        assert _get_warning_type_display_name(warning) == expected
 
 
 class TestUXPrintDeprecations:
     """Test the public ux.print_deprecations function."""
 
-    def test_print_deprecations_all_types(self) -> None:
-        """Test printing all types of deprecations."""
-        deprecator = get_test_deprecator("test-package", "1.5.0")
-
-        # Create different types of deprecations
-        deprecator.define("Pending", gone_in="3.0.0", warn_in="2.0.0")
-        deprecator.define("Active", gone_in="2.0.0", warn_in="1.0.0")
-        deprecator.define("Expired", gone_in="1.0.0", warn_in="0.5.0")
-
-        # Should not raise an exception and should show active and expired types
-        output = run_with_console_capture(print_deprecations, deprecator)
-        assert "test-package" in output
-        assert "Active" in output  # This should be shown as Warning
-        assert "Expired" in output  # This should be shown as Error
-
-    def test_print_deprecations_pending_only(self) -> None:
-        """Test printing only pending deprecations."""
-        deprecator = get_test_deprecator("test-package", "0.5.0")  # Earlier version
-
-        # Create different types of deprecations
-        deprecator.define("Pending", gone_in="3.0.0", warn_in="1.0.0")  # Future warning
-        deprecator.define("Active", gone_in="2.0.0", warn_in="0.1.0")  # Current warning
-        deprecator.define("Expired", gone_in="0.3.0", warn_in="0.1.0")  # Past expiry
-
-        # Should show only pending deprecations
+    @pytest.mark.parametrize(
+        ("flags", "shown"),
+        [
+            # the defaults show active and expired deprecations
+            ({}, {"Active", "Expired"}),
+            ({"pending": True, "active": False, "expired": False}, {"Pending"}),
+            ({"pending": False, "active": True, "expired": False}, {"Active"}),
+            ({"pending": False, "active": False, "expired": True}, {"Expired"}),
+        ],
+        ids=["default", "pending-only", "active-only", "expired-only"],
+    )
+    def test_print_deprecations_filtering(
+        self, three_type_deprecator: Deprecator, flags: dict[str, bool], shown: set[str]
+    ) -> None:
+        """Test that only the selected deprecation types are printed."""
         output = run_with_console_capture(
-            print_deprecations, deprecator, pending=True, active=False, expired=False
+            print_deprecations, three_type_deprecator, **flags
         )
-        assert "Pending" in output
-
-    def test_print_deprecations_active_only(self) -> None:
-        """Test printing only active deprecations."""
-        deprecator = get_test_deprecator("test-package", "1.5.0")
-
-        # Create different types of deprecations
-        deprecator.define("Pending", gone_in="3.0.0", warn_in="2.0.0")
-        deprecator.define("Active", gone_in="2.0.0", warn_in="1.0.0")
-        deprecator.define("Expired", gone_in="1.0.0", warn_in="0.5.0")
-
-        # Should show only active deprecations
-        output = run_with_console_capture(
-            print_deprecations, deprecator, pending=False, active=True, expired=False
-        )
-        assert "Active" in output
-
-    def test_print_deprecations_expired_only(self) -> None:
-        """Test printing only expired deprecations."""
-        deprecator = get_test_deprecator("test-package", "1.5.0")
-
-        # Create different types of deprecations
-        deprecator.define("Pending", gone_in="3.0.0", warn_in="2.0.0")
-        deprecator.define("Active", gone_in="2.0.0", warn_in="1.0.0")
-        deprecator.define("Expired", gone_in="1.0.0", warn_in="0.5.0")
-
-        # Should show only expired deprecations
-        output = run_with_console_capture(
-            print_deprecations, deprecator, pending=False, active=False, expired=True
-        )
-        assert "Expired" in output
+        assert "test-package" in output
+        for message in shown:
+            assert message in output
+        for message in {"Pending", "Active", "Expired"} - shown:
+            assert message not in output
 
     def test_print_deprecations_none_selected(self) -> None:
         """Test printing when no deprecation types are selected."""
@@ -267,26 +204,34 @@ class TestUXPrintDeprecations:
         with pytest.raises(TypeError):
             get_warning_types(pending=False, active=False, expired=False)
 
-    def test_print_deprecations_default_console(self) -> None:
+    def test_print_deprecations_default_console(
+        self, deprecator_v1_0: Deprecator
+    ) -> None:
         """Test printing with default console."""
-        deprecator = get_test_deprecator("test-package", "1.0.0")
-        deprecator.define("Test deprecation", gone_in="2.0.0", warn_in="1.5.0")
+        deprecator_v1_0.define("Test deprecation", gone_in="2.0.0", warn_in="1.5.0")
 
         # Should not raise an exception and should produce output
-        output = run_with_console_capture(print_deprecations, deprecator)
+        output = run_with_console_capture(print_deprecations, deprecator_v1_0)
         assert "test-package" in output
 
 
+@pytest.fixture(scope="module")
+def _real_package_deprecator() -> Deprecator:
+    # a private registry looks up the installed version once for the module and
+    # keeps the throwaway definitions off the default registry's real entry
+    registry = DeprecatorRegistry(framework=PackageName("deprecator"))
+    return registry.for_package("deprecator")
+
+
 class TestIntegrationWithRealPackage:
     """Integration tests using the actual deprecator package."""
 
-    def test_with_deprecator_package(self) -> None:
-        """Test with the actual deprecator package."""
-        from deprecator import for_package
-
-        # Get deprecator for the actual package
-        dep = for_package("deprecator")
+    @pytest.fixture
+    def dep(self, _real_package_deprecator: Deprecator) -> Deprecator:
+        return reset_tracked_deprecations(_real_package_deprecator)
 
+    def test_with_deprecator_package(self, dep: Deprecator) -> None:
+        """Test with the actual deprecator package."""
         # Add some test deprecations
         dep.define(
             "Integration test deprecation",
@@ -296,7 +241,7 @@ class TestIntegrationWithRealPackage:
 
         table = create_deprecations_table(
             dep,
-            warning_types=get_warning_types(pending=True, active=True, expired=True),
+            warning_types=ALL_TYPES,
         )
 
         assert isinstance(table, Table)
@@ -304,37 +249,28 @@ class TestIntegrationWithRealPackage:
         # Should have at least our test deprecation
         assert len(table.rows) >= 1
 
-    def test_filtering_with_real_package(self) -> None:
+    def test_filtering_with_real_package(self, dep: Deprecator) -> None:
         """Test filtering with the actual deprecator package."""
-        from deprecator import for_package
-
-        dep = for_package("deprecator")
-
         # Add deprecations of different types
         dep.define("Pending test", gone_in="999.0.0", warn_in="998.0.0")
 
         # Test filtering
         pending_table = create_deprecations_table(
             dep,
-            warning_types=get_warning_types(pending=True, active=False, expired=False),
+            warning_types=PENDING_ONLY,
         )
         all_table = create_deprecations_table(
             dep,
-            warning_types=get_warning_types(pending=True, active=True, expired=True),
+            warning_types=ALL_TYPES,
         )
 
         # Pending table should have fewer or equal rows than all table
         assert len(pending_table.rows) <= len(all_table.rows)
 
-    def test_ux_print_deprecations_with_real_package(self) -> None:
+    def test_ux_print_deprecations_with_real_package(self, dep: Deprecator) -> None:
         """Test the ux.print_deprecations function with real package."""
-        from deprecator import for_package
-
-        dep = for_package("deprecator")
-
         # Add some test deprecations
         dep.define("UX test deprecation", gone_in="999.0.0", warn_in="998.0.0")
 
         output = run_with_console_capture(print_deprecations, dep, pending=True)
-        print(output)  # Keep debug print for now
-        assert "UX test deprecation" in output, "not found, see print output"
+        assert "UX test deprecation" in output
@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
+import inspect
 import sys
 from types import ModuleType
 
 import pytest
-from conftest import TestVersions, assert_warnings, get_test_deprecator
+from conftest import TestVersions, assert_warnings
 from packaging.version import Version
 
 from deprecator._deprecator import Deprecator
-from deprecator._registry import default_registry
-from deprecator._warnings import create_package_warning_classes
 
 
 def test_warn_default_stacklevel(test_deprecator: Deprecator) -> None:
@@ -19,12 +18,13 @@ def test_warn_default_stacklevel(test_deprecator: Deprecator) -> None:
     warning = test_deprecator.define(
         "test warning", warn_in=TestVersions.PAST, gone_in=TestVersions.FUTURE
     )
+    warning_cls = type(warning)
 
-    with assert_warnings(1, type(warning)) as warning_list:
+    with assert_warnings(1, warning_cls) as warning_list:
         warning.warn()
 
     caught_warning = warning_list[0]
-    assert isinstance(caught_warning.message, type(warning))
+    assert isinstance(caught_warning.message, warning_cls)
     assert str(caught_warning.message) == "test warning"
 
 
@@ -33,55 +33,60 @@ def test_warn_custom_stacklevel(test_deprecator: Deprecator) -> None:
     warning = test_deprecator.define(
         "test warning", warn_in=TestVersions.PAST, gone_in=TestVersions.FUTURE
     )
+    warning_cls = type(warning)
+
+    warn = warning.warn
 
     def wrapper_function() -> None:
-        warning.warn(stacklevel=3)  # Skip this wrapper
+        warn(stacklevel=3)  # Skip this wrapper
 
-    with assert_warnings(1, type(warning)) as warning_list:
+    with assert_warnings(1, warning_cls) as warning_list:
         wrapper_function()
 
     caught_warning = warning_list[0]
-    assert isinstance(caught_warning.message, type(warning))
+    assert isinstance(caught_warning.message, warning_cls)
     assert str(caught_warning.message) == "test warning"
 
 
-def test_warn_explicit_with_filename_lineno(test_deprecator: Deprecator) -> None:
-    """Test that warn_explicit() works with filename and lineno."""
+@pytest.mark.parametrize(
+    ("warn_in", "lineno", "module", "category"),
+    [
+        (TestVersions.PAST, 42, None, DeprecationWarning),
+        (TestVersions.PAST, 100, "test_module", DeprecationWarning),
+        # warn_in is still in the future
+        (TestVersions.INTERMEDIATE, 42, None, PendingDeprecationWarning),
+    ],
+    ids=["filename-lineno", "module", "pending"],
+)
+def test_warn_explicit(
+    test_deprecator: Deprecator,
+    warn_in: Version,
+    lineno: int,
+    module: str | None,
+    category: type[Warning],
+) -> None:
+    """Test that warn_explicit() reports the given location and stdlib category."""
     warning = test_deprecator.define(
-        "explicit test warning", warn_in=TestVersions.PAST, gone_in=TestVersions.FUTURE
+        "explicit test warning", warn_in=warn_in, gone_in=TestVersions.FUTURE
     )
 
-    with assert_warnings(1, DeprecationWarning) as warning_list:
-        warning.warn_explicit("test_file.py", 42)
+    with assert_warnings(1, category) as warning_list:
+        warning.warn_explicit("test_file.py", lineno, module=module)
 
     caught_warning = warning_list[0]
     assert str(caught_warning.message) == "explicit test warning"
     assert caught_warning.filename == "test_file.py"
-    assert caught_warning.lineno == 42
-    assert caught_warning.category is DeprecationWarning  # Should use stdlib category
-
-
-def test_warn_explicit_with_module(test_deprecator: Deprecator) -> None:
-    """Test that warn_explicit() works with module name."""
-    warning = test_deprecator.define(
-        "module test warning", warn_in=TestVersions.PAST, gone_in=TestVersions.FUTURE
-    )
-
-    with assert_warnings(1, DeprecationWarning) as warning_list:
-        warning.warn_explicit("test_file.py", 100, module="test_module")
-
-    caught_warning = warning_list[0]
-    assert str(caught_warning.message) == "module test warning"
-    assert caught_warning.filename == "test_file.py"
-    assert caught_warning.lineno == 100
-    assert caught_warning.category is DeprecationWarning
+    assert caught_warning.lineno == lineno
+    assert caught_warning.category is category  # Should use stdlib category
 
 
 def test_different_warning_categories(test_deprecator: Deprecator) -> None:
     """Test that different warning categories are emitted correctly."""
     # Pending (future warning)
     pending_warning = test_deprecator.define(
-        "pending warning", warn_in="1.5.0", gone_in=TestVersions.FUTURE
+        "pending warning",
+        warn_in=TestVersions.INTERMEDIATE,
+        gone_in=TestVersions.FUTURE,
     )
 
     # Active (current warning)
@@ -95,63 +100,33 @@ def test_different_warning_categories(test_deprecator: Deprecator) -> None:
 
     # Check pending warning
     pending_caught = warning_list[0]
-    assert "PendingDeprecationWarning" in str(type(pending_caught.message))
+    assert issubclass(pending_caught.category, PendingDeprecationWarning)
     assert str(pending_caught.message) == "pending warning"
 
     # Check active warning
     active_caught = warning_list[1]
-    assert "DeprecationWarning" in str(type(active_caught.message))
+    assert issubclass(active_caught.category, DeprecationWarning)
     assert str(active_caught.message) == "active warning"
 
 
-def test_warn_methods_are_instance_methods() -> None:
+def test_warn_methods_are_instance_methods(test_deprecator: Deprecator) -> None:
     """Test that warn methods are available on warning instances."""
-    pending, deprecation, expired_warning = create_package_warning_classes(
-        "test_instance", Version("1.0.0")
-    )
-    deprecator = Deprecator(
-        "test_instance",
-        Version("1.0.0"),
-        pending=pending,
-        deprecation=deprecation,
-        expired_warning=expired_warning,
-        registry=default_registry,
-    )
-    warning = deprecator.define(
+    warning = test_deprecator.define(
         "instance test", warn_in=TestVersions.PAST, gone_in=TestVersions.FUTURE
     )
 
-    # Check that methods exist and are callable
-    assert hasattr(warning, "warn")
-    assert callable(warning.warn)
-    assert hasattr(warning, "warn_explicit")
-    assert callable(warning.warn_explicit)
-
-
-def test_warn_explicit_pending_warning(test_deprecator: Deprecator) -> None:
-    """Test that warn_explicit() works with PendingDeprecationWarning."""
-    # Create a pending warning (warn_in is in the future)
-    pending_warning = test_deprecator.define(
-        "pending test warning", warn_in="1.5.0", gone_in=TestVersions.FUTURE
-    )
-
-    with assert_warnings(1, PendingDeprecationWarning) as warning_list:
-        pending_warning.warn_explicit("test_file.py", 42)
+    # Look the methods up on the class without binding them to the instance
+    warning_cls = type(warning)
+    assert inspect.isfunction(inspect.getattr_static(warning_cls, "warn"))
+    assert inspect.isfunction(inspect.getattr_static(warning_cls, "warn_explicit"))
 
-    caught_warning = warning_list[0]
-    assert str(caught_warning.message) == "pending test warning"
-    assert caught_warning.category is PendingDeprecationWarning
 
-
-def test_warning_with_replacement_message() -> None:
+def test_warning_with_replacement_message(test_deprecator: Deprecator) -> None:
     """Test that warnings with replacement show proper message."""
-    from conftest import get_test_deprecator
-
-    deprecator = get_test_deprecator("test_replace", "1.0.0")
-    warning = deprecator.define(
+    warning = test_deprecator.define(
         "old function is deprecated",
-        warn_in="0.5.0",
-        gone_in="2.0.0",
+        warn_in=TestVersions.PAST,
+        gone_in=TestVersions.FUTURE,
         replace_with="new_function()",
     )
 
@@ -165,42 +140,31 @@ def test_warning_with_replacement_message() -> None:
 
 
 # Tests for warning __repr__ from test_improvements.py
-def test_warning_instance_repr() -> None:
-    """Test that warning instances have useful __repr__ showing version info."""
-    deprecator = get_test_deprecator(":test_package", TestVersions.CURRENT)
-    warning = deprecator.define(
+def test_warning_repr(test_deprecator: Deprecator) -> None:
+    """Test that warning instances and classes have useful __repr__ output."""
+    warning = test_deprecator.define(
         "Test deprecation",
         gone_in=TestVersions.FUTURE,
         warn_in=TestVersions.PAST,
     )
     repr_str = repr(warning)
-
-    # Should show version information
-    assert "gone_in" in repr_str or str(TestVersions.FUTURE) in repr_str
-    assert "warn_in" in repr_str or str(TestVersions.PAST) in repr_str
-
-
-def test_warning_class_repr() -> None:
-    """Test that warning classes show their categorization info."""
-    deprecator = get_test_deprecator(":test_package", TestVersions.CURRENT)
-    warning = deprecator.define(
-        "Test deprecation",
-        gone_in=TestVersions.FUTURE,
-        warn_in=TestVersions.PAST,
-    )
     class_repr = repr(type(warning))
 
+    # Instances should show version information
+    assert "gone_in" in repr_str or TestVersions.FUTURE_STR in repr_str
+    assert "warn_in" in repr_str or TestVersions.PAST_STR in repr_str
     # Class repr should indicate it's a deprecation warning type
     assert "DeprecationWarning" in class_repr
 
 
 # Performance and caching tests from test_improvements.py
-def test_find_warning_in_modules_function() -> None:
+def test_find_warning_in_modules_function(
+    test_deprecator: Deprecator, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test the standalone find_warning_in_modules function."""
     from deprecator._warnings import find_warning_in_modules
 
-    deprecator = get_test_deprecator(":test_package", TestVersions.CURRENT)
-    warning = deprecator.define(
+    warning = test_deprecator.define(
         "Test deprecation",
         gone_in=TestVersions.FUTURE,
         warn_in=TestVersions.PAST,
@@ -219,7 +183,9 @@ def test_find_warning_in_modules_function() -> None:
     assert find_warning_in_modules(warning, {}) is None
 
     # Test with None modules (uses sys.modules)
-    sys.modules[__name__].__dict__["test_warning_in_sys"] = warning
+    monkeypatch.setattr(
+        sys.modules[__name__], "test_warning_in_sys", warning, raising=False
+    )
     name = find_warning_in_modules(warning)
     assert name is not None
     assert "test_warning_in_sys" in name
@@ -229,17 +195,20 @@ def test_find_warning_in_modules_function() -> None:
 # which tests the new cached property implementation
 
 
-def test_importable_name_cached_property() -> None:
+def test_importable_name_cached_property(
+    test_deprecator: Deprecator, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test the importable_name cached property."""
-    deprecator = get_test_deprecator(":test_package", TestVersions.CURRENT)
-    warning = deprecator.define(
+    warning = test_deprecator.define(
         "Test deprecation",
         gone_in=TestVersions.FUTURE,
         warn_in=TestVersions.PAST,
     )
 
     # Add to module for finding
-    sys.modules[__name__].__dict__["test_cached_prop"] = warning
+    monkeypatch.setattr(
+        sys.modules[__name__], "test_cached_prop", warning, raising=False
+    )
 
     # First access should find and cache
     name1 = warning.importable_name
@@ -247,7 +216,7 @@ def test_importable_name_cached_property() -> None:
     assert "test_cached_prop" in name1
 
     # Remove from module
-    del sys.modules[__name__].__dict__["test_cached_prop"]
+    monkeypatch.delattr(sys.modules[__name__], "test_cached_prop")
 
     # Second access should return cached value
     name2 = warning.importable_name
@@ -260,10 +229,9 @@ def test_importable_name_cached_property() -> None:
 
 
 # Edge case test for warn_explicit
-def test_warning_warn_explicit_with_edge_cases() -> None:
+def test_warning_warn_explicit_with_edge_cases(test_deprecator: Deprecator) -> None:
     """Test the warn_explicit method with various inputs."""
-    deprecator = get_test_deprecator(":test_package", TestVersions.CURRENT)
-    warning = deprecator.define(
+    warning = test_deprecator.define(
         "Test deprecation",
         gone_in=TestVersions.FUTURE,
         warn_in=TestVersions.PAST,
@@ -279,22 +247,23 @@ def test_warning_warn_explicit_with_edge_cases() -> None:
 
 
 # ClassVar initialization test from test_improvements.py
-def test_class_var_initialization() -> None:
+def test_class_var_initialization(test_deprecator: Deprecator) -> None:
     """Test that ClassVars are properly initialized on warning classes."""
-    deprecator = get_test_deprecator(":test_package", TestVersions.CURRENT)
-    warning = deprecator.define(
+    warning = test_deprecator.define(
         "Test deprecation",
         gone_in=TestVersions.FUTURE,
         warn_in=TestVersions.PAST,
     )
 
+    warning_cls = type(warning)
+
     # Check ClassVars are set
-    assert hasattr(type(warning), "gone_in")
-    assert hasattr(type(warning), "warn_in")
-    assert hasattr(type(warning), "current_version")
-    assert hasattr(type(warning), "package_name")
+    assert hasattr(warning_cls, "gone_in")
+    assert hasattr(warning_cls, "warn_in")
+    assert hasattr(warning_cls, "current_version")
+    assert hasattr(warning_cls, "package_name")
 
     # Check values
-    assert type(warning).gone_in == TestVersions.FUTURE
-    assert type(warning).warn_in == TestVersions.PAST
-    assert type(warning).current_version == TestVersions.CURRENT
+    assert warning_cls.gone_in == TestVersions.FUTURE
+    assert warning_cls.warn_in == TestVersions.PAST
+    assert warning_cls.current_version == TestVersions.CURRENT